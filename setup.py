@@ -24,4 +24,5 @@ setuptools.setup(
     packages=setuptools.find_packages(where="src"),
     python_requires=">=3.6",
     install_requires=["requests"],
+    extras_require={"orjson": ["orjson"], "brotli": ["brotli"]},
 )
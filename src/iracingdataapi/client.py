@@ -1,55 +1,223 @@
 import base64
+import copy
 import csv
+import functools
 import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import LWPCookieJar
 from io import StringIO
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Optional, Sequence, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# attempts made for a request which keeps being rate limited or unauthorised
+MAX_RETRIES = 5
+
+# linked resources remembered for conditional requests
+MAX_ETAGS = 64
+
+# larger bodies, such as full subsession results, are not kept for revalidation
+MAX_ETAG_BODY_SIZE = 256 * 1024
+
+
+def _drop_none(payload: dict) -> dict:
+    # only None means "not given", so legal values such as 0 or False are kept
+    return {k: v for k, v in payload.items() if v is not None}
+
+
+def ttl_cache(ttl: int = 3600):
+    """Memoizes a client method's return value for ``ttl`` seconds.
+
+    Results are stored per client instance in ``self._cache``, keyed by the
+    method name and its arguments. Intended for reference data which rarely
+    changes, such as cars, tracks and constants. Every call returns a copy, so
+    callers can modify the result without affecting later calls.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (func.__name__, args, frozenset(kwargs.items()))
+            cached = self._cache.get(key)
+            now = time.monotonic()
+            if cached is not None and cached[0] > now:
+                return copy.deepcopy(cached[1])
+
+            value = func(self, *args, **kwargs)
+            self._cache[key] = (now + ttl, value)
+            return copy.deepcopy(value)
+
+        return wrapper
+
+    return decorator
+
+
+def disk_cache(max_age: Optional[int] = None):
+    """Persists a client method's return value as JSON under ``self.cache_dir``.
+
+    Without a ``max_age`` this is only intended for data which never changes
+    once it is available, such as the results of a finished subsession. With
+    one, files older than ``max_age`` seconds are fetched again. Has no effect
+    unless the client was created with a ``cache_dir``.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.cache_dir is None:
+                return func(self, *args, **kwargs)
+
+            key = repr((args, sorted(kwargs.items())))
+            digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+            path = os.path.join(self.cache_dir, f"{func.__name__}-{digest}.json")
+            try:
+                if max_age is None or os.path.getmtime(path) + max_age > time.time():
+                    with open(path, "r", encoding="utf-8") as f:
+                        return json.load(f)
+            except (OSError, ValueError):
+                # missing, unreadable or truncated files are fetched again
+                pass
+
+            value = func(self, *args, **kwargs)
+            if value is None:
+                # nothing usable was returned, so try again on the next call
+                return value
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # write to a temporary file first so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            return value
+
+        return wrapper
+
+    return decorator
 
 
 class irDataClient:
+    _shared_adapter: Optional[HTTPAdapter] = None
+    _shared_adapter_lock = threading.Lock()
 
-    def __init__(self, username=None, password=None, silent=False):
+    def __init__(
+        self,
+        username=None,
+        password=None,
+        silent=False,
+        cache_dir: Optional[str] = None,
+        cookie_file: Optional[str] = None,
+        share_connection_pool: bool = False,
+    ):
         self.authenticated = False
+        # serialises logins, so concurrent requests on a fresh client log in once
+        self._login_lock = threading.Lock()
         self.session = requests.Session()
+        if share_connection_pool:
+            adapter = self._get_shared_adapter()
+        else:
+            adapter = self._build_adapter()
+        self.session.mount("https://", adapter)
+        # advertise every encoding urllib3 can decode, including brotli when installed
+        self.session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)[
+            "accept-encoding"
+        ]
         self.base_url = "https://members-ng.iracing.com"
         self.silent = silent
+        self._cache = {}
+        self._etags = {}
+        self._etags_lock = threading.Lock()
+        self._rate_limit_remaining = None
+        self._rate_limit_reset = None
+        self.cache_dir = cache_dir
 
         self.username = username
-        self.encoded_password = self._encode_password(username, password)
+        self._password = password
+        self.encoded_password = None
+
+        self.cookie_file = cookie_file
+        if cookie_file:
+            self.session.cookies = LWPCookieJar(cookie_file)
+            if os.path.exists(cookie_file):
+                self.session.cookies.load(ignore_discard=True)
+                # assume the saved session is still valid, a 401 will trigger a new login
+                self.authenticated = True
+
+    @staticmethod
+    def _build_adapter() -> HTTPAdapter:
+        # size the pool for the concurrent chunk downloads in _get_chunks, and
+        # retry transient gateway errors before they reach the caller
+        return HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+
+    @classmethod
+    def _get_shared_adapter(cls) -> HTTPAdapter:
+        # only the connection pool is shared, each client keeps its own session
+        # so that cookies from different logins never mix
+        with cls._shared_adapter_lock:
+            if cls._shared_adapter is None:
+                cls._shared_adapter = cls._build_adapter()
+            return cls._shared_adapter
 
     def _encode_password(self, username: str, password: str) -> str:
-        initial_hash = hashlib.sha256(
-            (password + username.lower()).encode("utf-8")
-        ).digest()
+        initial_hash = hashlib.sha256()
+        initial_hash.update(password.encode("utf-8"))
+        initial_hash.update(username.lower().encode("utf-8"))
 
-        return base64.b64encode(initial_hash).decode("utf-8")
+        return base64.b64encode(initial_hash.digest()).decode("ascii")
 
     def _login(self) -> str:
         headers = {"Content-Type": "application/json"}
+        if self.encoded_password is None:
+            if not self.username or not self._password:
+                raise RuntimeError("username and password are required to log in")
+            self.encoded_password = self._encode_password(self.username, self._password)
+            # only the hash is needed from now on, so do not keep the plaintext
+            self._password = None
         data = {"email": self.username, "password": self.encoded_password}
 
         try:
-            r = self.session.post(
-                "https://members-ng.iracing.com/auth",
-                headers=headers,
-                json=data,
-                timeout=5.0,
-            )
-            if r.status_code == 429:
-                ratelimit_reset = r.headers.get("x-ratelimit-reset")
-                if ratelimit_reset:
-                    reset_datetime = datetime.fromtimestamp(int(ratelimit_reset))
-                    delta = (
-                        reset_datetime - datetime.now() + timedelta(milliseconds=500)
-                    )
-                    if not self.silent:
-                        print(f"Rate limited, waiting {delta.total_seconds()} seconds")
-                    if delta.total_seconds() > 0:
-                        time.sleep(delta.total_seconds())
-                return self._login()
+            for attempt in range(MAX_RETRIES):
+                r = self.session.post(
+                    "https://members-ng.iracing.com/auth",
+                    headers=headers,
+                    json=data,
+                    timeout=5.0,
+                )
+                if r.status_code != 429:
+                    break
+                self._wait_after_rate_limit(r, attempt)
+            else:
+                raise RuntimeError("Rate limited, gave up logging in", r)
         except requests.Timeout:
             raise RuntimeError("Login timed out")
         except requests.ConnectionError:
@@ -58,71 +226,129 @@ class irDataClient:
             response_data = r.json()
             if r.status_code == 200 and response_data.get("authcode"):
                 self.authenticated = True
+                # a new login means the previous session expired, so refresh cached data too
+                self._cache.clear()
+                if self.cookie_file:
+                    self._save_cookies()
                 return "Logged in"
             else:
                 raise RuntimeError("Error from iRacing: ", response_data)
 
+    def _save_cookies(self) -> None:
+        # the cookies authenticate as the member, so keep them private to the owner
+        fd = os.open(self.cookie_file, os.O_WRONLY | os.O_CREAT, 0o600)
+        os.close(fd)
+        os.chmod(self.cookie_file, 0o600)
+        self.session.cookies.save(ignore_discard=True)
+
+    def _ensure_authenticated(self) -> None:
+        with self._login_lock:
+            # another thread may have logged in while this one was waiting
+            if not self.authenticated:
+                self._login()
+
     def _build_url(self, endpoint: str) -> str:
         return self.base_url + endpoint
 
     def _get_resource_or_link(
         self, url: str, payload: dict = None
     ) -> list[Union[Dict, str], bool]:
-        if not self.authenticated:
-            self._login()
-            return self._get_resource_or_link(url, payload=payload)
+        for attempt in range(MAX_RETRIES):
+            r = self._get_authenticated(url, payload=payload)
+            if r.status_code != 429:
+                break
+            self._wait_after_rate_limit(r, attempt)
+        else:
+            raise RuntimeError("Rate limited, gave up retrying", r)
 
-        r = self.session.get(url, params=payload)
+        if r.status_code != 200:
+            raise RuntimeError("Unhandled Non-200 response", r)
+        data = self._parse_json(r)
+        if isinstance(data, dict) and "link" in data:
+            return [data["link"], True]
+        return [data, False]
+
+    def _get_authenticated(
+        self, url: str, payload: Optional[dict] = None
+    ) -> requests.Response:
+        for _ in range(2):
+            if not self.authenticated:
+                self._ensure_authenticated()
+
+            self._wait_for_rate_limit()
+            r = self.session.get(url, params=payload or None)
+            self._update_rate_limit(r)
+            if r.status_code != 401:
+                return r
 
-        if r.status_code == 401 and self.authenticated:
             # unauthorised, likely due to a timeout, retry after a login
             self.authenticated = False
-            return self._get_resource_or_link(url, payload=payload)
-
-        if r.status_code == 429:
-            ratelimit_reset = r.headers.get("x-ratelimit-reset")
-            if ratelimit_reset:
-                reset_datetime = datetime.fromtimestamp(int(ratelimit_reset))
-                delta = reset_datetime - datetime.now() + timedelta(milliseconds=500)
-                if not self.silent:
-                    print(f"Rate limited, waiting {delta.total_seconds()} seconds")
-                if delta.total_seconds() > 0:
-                    time.sleep(delta.total_seconds())
-            return self._get_resource_or_link(url, payload=payload)
 
-        if r.status_code != 200:
-            raise RuntimeError("Unhandled Non-200 response", r)
-        data = r.json()
-        if not isinstance(data, list) and "link" in data.keys():
-            return [data.get("link"), True]
+        raise RuntimeError("Unauthorised after logging in again", r)
+
+    def _update_rate_limit(self, r: requests.Response) -> None:
+        remaining = r.headers.get("x-ratelimit-remaining")
+        reset = r.headers.get("x-ratelimit-reset")
+        if remaining is not None and reset is not None:
+            self._rate_limit_remaining = int(remaining)
+            self._rate_limit_reset = int(reset)
+
+    def _wait_for_rate_limit(self) -> None:
+        # once the allowance is used up, wait for the reset rather than provoking a 429
+        if self._rate_limit_remaining is not None and self._rate_limit_remaining <= 0:
+            delay = self._seconds_until_reset(self._rate_limit_reset)
+            if delay > 0:
+                time.sleep(delay)
+            self._rate_limit_remaining = None
+
+    @staticmethod
+    def _seconds_until_reset(reset: Union[int, str]) -> float:
+        return int(reset) - time.time()
+
+    def _wait_after_rate_limit(self, r: requests.Response, attempt: int) -> None:
+        # random jitter stops clients released at the same reset time from
+        # immediately colliding again
+        jitter = random.uniform(0, min(0.25 * 2**attempt, 5))
+        ratelimit_reset = r.headers.get("x-ratelimit-reset")
+        if ratelimit_reset:
+            delay = self._seconds_until_reset(ratelimit_reset) + 0.5
+            wait = max(delay, 0) + jitter
+            if not self.silent:
+                logger.info("Rate limited, waiting %.1f seconds", wait)
         else:
-            return [data, False]
+            # no reset time given, back off exponentially up to 30 seconds
+            wait = min(0.25 * 2**attempt, 30) + jitter
+        time.sleep(wait)
 
     def _get_resource(
         self, endpoint: str, payload: Optional[dict] = None
     ) -> Optional[Union[list, dict]]:
         request_url = self._build_url(endpoint)
-        resource_obj, is_link = self._get_resource_or_link(request_url, payload=payload)
-
-        if not is_link:
-            return resource_obj
-        r = self.session.get(resource_obj)
+        key = self._etag_key(endpoint, payload)
+        cached = self._etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        for attempt in range(MAX_RETRIES):
+            resource_obj, is_link = self._get_resource_or_link(
+                request_url, payload=payload
+            )
+            if not is_link:
+                return resource_obj
+            r = self.session.get(resource_obj, headers=headers)
+
+            if r.status_code == 401 and self.authenticated:
+                # Unauthenticated, likely due to a timeout, retry after a login
+                self.authenticated = False
+                self._ensure_authenticated()
+            elif r.status_code == 429:
+                self._wait_after_rate_limit(r, attempt)
+            else:
+                break
+        else:
+            raise RuntimeError("Gave up retrying", r)
 
-        if r.status_code == 401 and self.authenticated:
-            # Unauthenticated, likely due to a timeout, retry after a login
-            self.authenticated = False
-            self._login()
-            return self._get_resource(endpoint, payload=payload)
-
-        if r.status_code == 429:
-            print("Rate limited, waiting")
-            ratelimit_reset = r.headers.get("x-ratelimit-reset")
-            if ratelimit_reset:
-                reset_datetime = datetime.fromtimestamp(int(ratelimit_reset))
-                delta = reset_datetime - datetime.now()
-                if delta.total_seconds() > 0:
-                    time.sleep(delta.total_seconds())
-            return self._get_resource(endpoint, payload=payload)
+        if r.status_code == 304 and cached:
+            # parse the stored body again, so callers never share a mutable result
+            return self._parse_body(cached[1], cached[2])
 
         if r.status_code != 200:
             raise RuntimeError("Unhandled Non-200 response", r)
@@ -130,32 +356,108 @@ class irDataClient:
         content_type = r.headers.get("Content-Type")
 
         if "application/json" in content_type:
-            return r.json()
+            data = self._parse_json(r)
+            body = r.content
 
         elif "text/csv" in content_type or "text/plain" in content_type:
-            return self._parse_csv_response(r.text)
+            body = r.text
+            data = self._parse_csv_response(body)
 
         else:
-            print("Error: Unsupported Content-Type")
+            logger.error("Unsupported Content-Type: %s", content_type)
             return None
 
+        etag = r.headers.get("ETag")
+        if etag and len(body) <= MAX_ETAG_BODY_SIZE:
+            # _get_resource runs on several threads for batch and concurrent calls
+            with self._etags_lock:
+                self._etags.pop(key, None)
+                if len(self._etags) >= MAX_ETAGS:
+                    # forget the least recently stored resource
+                    del self._etags[next(iter(self._etags))]
+                self._etags[key] = (etag, content_type, body)
+        return data
+
+    @staticmethod
+    def _etag_key(endpoint: str, payload: Optional[dict]) -> tuple:
+        # payload values may be lists, such as event_types, which are not hashable
+        items = (payload or {}).items()
+        return (
+            endpoint,
+            tuple(
+                sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in items)
+            ),
+        )
+
+    def _parse_body(self, content_type: str, body: Union[bytes, str]) -> list:
+        if "application/json" in content_type:
+            return orjson.loads(body) if orjson is not None else json.loads(body)
+        return self._parse_csv_response(body)
+
     def _get_chunks(self, chunks) -> list:
         if not isinstance(chunks, dict):
             # if there are no chunks, return an empty list for compatibility
             return []
         base_url = chunks.get("base_download_url")
         urls = [base_url + x for x in chunks.get("chunk_file_names")]
-        list_of_chunks = [self.session.get(url).json() for url in urls]
-        output = [item for sublist in list_of_chunks for item in sublist]
+        if not urls:
+            return []
+
+        # chunks are independent files, so download them concurrently.
+        # executor.map preserves the order of the urls.
+        output = []
+        with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+            for chunk in executor.map(self._get_chunk, urls):
+                output.extend(chunk)
 
         return output
 
+    def _get_chunk(self, url: str) -> list:
+        for attempt in range(MAX_RETRIES):
+            r = self.session.get(url)
+            if r.status_code != 429:
+                break
+            self._wait_after_rate_limit(r, attempt)
+        else:
+            raise RuntimeError("Rate limited, gave up retrying", r)
+
+        if r.status_code != 200:
+            raise RuntimeError("Unhandled Non-200 response", r)
+        return self._parse_json(r)
+
+    def _parse_json(self, r: requests.Response) -> Union[list, dict]:
+        # orjson decodes the raw bytes directly and is considerably faster than
+        # the stdlib json used by Response.json() on large result payloads
+        if orjson is not None:
+            return orjson.loads(r.content)
+        return r.json()
+
+    def _run_concurrently(self, *funcs) -> list:
+        # runs independent requests side by side, returning results in call order
+        with ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+            futures = [executor.submit(func) for func in funcs]
+            return [future.result() for future in futures]
+
+    def _get_resources_many(self, specs: list) -> list:
+        # fetches several (endpoint, payload) pairs side by side, so that the
+        # two requests behind each resource overlap with those of the others
+        if not specs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(16, len(specs))) as executor:
+            futures = [
+                executor.submit(self._get_resource, endpoint, payload)
+                for endpoint, payload in specs
+            ]
+            return [future.result() for future in futures]
+
     def _add_assets(self, objects: list, assets: dict, id_key: str) -> list:
+        # copy each object so the cached responses of the getters are not modified
+        output = []
         for obj in objects:
-            a = assets[str(obj[id_key])]
-            for key in a.keys():
-                obj[key] = a[key]
-        return objects
+            obj = dict(obj)
+            obj.update(assets[str(obj[id_key])])
+            output.append(obj)
+        return output
 
     def _parse_csv_response(self, text: str) -> list:
         csv_data = []
@@ -167,28 +469,34 @@ class irDataClient:
             if len(row) == len(headers):
                 csv_data.append(dict(zip(headers, row)))
             else:
-                print("Warning: Row length does not match headers length")
+                logger.warning("Row length does not match headers length")
 
         return csv_data
 
     @property
+    @ttl_cache()
     def cars(self) -> list[Dict]:
-        cars = self.get_cars()
-        car_assets = self.get_cars_assets()
+        cars, car_assets = self._run_concurrently(self.get_cars, self.get_cars_assets)
         return self._add_assets(cars, car_assets, "car_id")
 
     @property
+    @ttl_cache()
     def tracks(self) -> list[Dict]:
-        tracks = self.get_tracks()
-        track_assets = self.get_tracks_assets()
+        tracks, track_assets = self._run_concurrently(
+            self.get_tracks, self.get_tracks_assets
+        )
         return self._add_assets(tracks, track_assets, "track_id")
 
     @property
+    @ttl_cache()
     def series(self) -> list[Dict]:
-        series = self.get_series()
-        series_assets = self.get_series_assets()
+        series, series_assets = self._run_concurrently(
+            self.get_series, self.get_series_assets
+        )
         return self._add_assets(series, series_assets, "series_id")
 
+    @ttl_cache()
+    @disk_cache(max_age=86400)
     def constants_categories(self) -> list[Dict]:
         """Fetches a list containing the racing categories.
 
@@ -201,6 +509,8 @@ class irDataClient:
         """
         return self._get_resource("/data/constants/categories")
 
+    @ttl_cache()
+    @disk_cache(max_age=86400)
     def constants_divisions(self) -> list[Dict]:
         """Fetches a list containing the racing divisions.
 
@@ -213,6 +523,8 @@ class irDataClient:
         """
         return self._get_resource("/data/constants/divisions")
 
+    @ttl_cache()
+    @disk_cache(max_age=86400)
     def constants_event_types(self) -> list[Dict]:
         """Fetches a list containing the event types.
 
@@ -252,6 +564,7 @@ class irDataClient:
         endpoint = category_endpoints[category_id]
         return self._get_resource(endpoint)
 
+    @ttl_cache()
     def get_cars(self) -> list[Dict]:
         """Fetches a list containing all the cars in the service.
 
@@ -263,6 +576,7 @@ class irDataClient:
         """
         return self._get_resource("/data/car/get")
 
+    @ttl_cache()
     def get_cars_assets(self) -> Dict:
         """Fetches a list containing all the car assets in the service.
 
@@ -274,6 +588,7 @@ class irDataClient:
         """
         return self._get_resource("/data/car/assets")
 
+    @ttl_cache()
     def get_carclasses(self) -> list[Dict]:
         """Fetches a list containing all the car classes in the service.
 
@@ -286,6 +601,7 @@ class irDataClient:
         """
         return self._get_resource("/data/carclass/get")
 
+    @ttl_cache()
     def get_tracks(self) -> list[Dict]:
         """Fetches a list containing all the tracks in the service.
 
@@ -297,6 +613,7 @@ class irDataClient:
         """
         return self._get_resource("/data/track/get")
 
+    @ttl_cache()
     def get_tracks_assets(self) -> Dict:
         """Fetches a dict containing all the track assets in the service.
 
@@ -417,11 +734,21 @@ class irDataClient:
             dict: a dict with the request info including the leagues from the search requested.
 
         """
-        params = locals()
-        payload = {}
-        for x in params.keys():
-            if x != "self":
-                payload[x] = params[x]
+        payload = {
+            "search": search,
+            "tag": tag,
+            "restrict_to_member": restrict_to_member,
+            "restrict_to_recruiting": restrict_to_recruiting,
+            "restrict_to_friends": restrict_to_friends,
+            "restrict_to_watched": restrict_to_watched,
+            "minimum_roster_count": minimum_roster_count,
+            "maximum_roster_count": maximum_roster_count,
+            "lowerbound": lowerbound,
+            "upperbound": upperbound,
+            "sort": sort,
+            "order": order,
+        }
+        payload = _drop_none(payload)
 
         return self._get_resource("/data/league/directory", payload=payload)
 
@@ -560,6 +887,8 @@ class irDataClient:
         payload = {"season_year": season_year, "season_quarter": season_quarter}
         return self._get_resource("/data/lookup/club_history", payload=payload)
 
+    @ttl_cache()
+    @disk_cache(max_age=86400)
     def lookup_countries(self) -> list[Dict]:
         """The list of country names and the country codes.
 
@@ -591,9 +920,13 @@ class irDataClient:
 
         return self._get_resource("/data/lookup/drivers", payload=payload)
 
+    @ttl_cache()
+    @disk_cache(max_age=86400)
     def lookup_get(self) -> list:
         return self._get_resource("/data/lookup/get")
 
+    @ttl_cache()
+    @disk_cache(max_age=86400)
     def lookup_licenses(self) -> list[Dict]:
         """All the iRacing licenses.
 
@@ -605,6 +938,7 @@ class irDataClient:
         """
         return self._get_resource("/data/lookup/licenses")
 
+    @disk_cache()
     def result(self, subsession_id: int, include_licenses: bool = False) -> Dict:
         """Get the results from a specific session.
 
@@ -624,6 +958,7 @@ class irDataClient:
         payload = {"subsession_id": subsession_id, "include_licenses": include_licenses}
         return self._get_resource("/data/results/get", payload=payload)
 
+    @disk_cache()
     def result_lap_chart_data(
         self, subsession_id: int, simsession_number: int = 0
     ) -> list[Dict]:
@@ -648,6 +983,7 @@ class irDataClient:
         resource = self._get_resource("/data/results/lap_chart_data", payload=payload)
         return self._get_chunks(resource.get("chunk_info"))
 
+    @disk_cache()
     def result_lap_data(
         self,
         subsession_id: int,
@@ -691,6 +1027,7 @@ class irDataClient:
         # on this subsession, return an empty list for compatibility
         return []
 
+    @disk_cache()
     def result_event_log(
         self, subsession_id: int, simsession_number: int = 0
     ) -> list[Dict]:
@@ -765,11 +1102,21 @@ class irDataClient:
         if not (cust_id or host_cust_id):
             raise RuntimeError("Please supply either cust_id or host_cust_id")
 
-        params = locals()
-        payload = {}
-        for x in params.keys():
-            if x != "self" and params[x]:
-                payload[x] = params[x]
+        payload = {
+            "start_range_begin": start_range_begin,
+            "start_range_end": start_range_end,
+            "finish_range_begin": finish_range_begin,
+            "finish_range_end": finish_range_end,
+            "cust_id": cust_id,
+            "host_cust_id": host_cust_id,
+            "session_name": session_name,
+            "league_id": league_id,
+            "league_season_id": league_season_id,
+            "car_id": car_id,
+            "track_id": track_id,
+            "category_ids": category_ids,
+        }
+        payload = _drop_none(payload)
 
         resource = self._get_resource("/data/results/search_hosted", payload=payload)
         return self._get_chunks(resource.get("data", dict()).get("chunk_info"))
@@ -826,11 +1173,21 @@ class irDataClient:
                 "Please supply Season Year and Season Quarter or a date range"
             )
 
-        params = locals()
-        payload = {}
-        for x in params.keys():
-            if x != "self" and params[x]:
-                payload[x] = params[x]
+        payload = {
+            "season_year": season_year,
+            "season_quarter": season_quarter,
+            "start_range_begin": start_range_begin,
+            "start_range_end": start_range_end,
+            "finish_range_begin": finish_range_begin,
+            "finish_range_end": finish_range_end,
+            "cust_id": cust_id,
+            "series_id": series_id,
+            "race_week_num": race_week_num,
+            "official_only": official_only,
+            "event_types": event_types,
+            "category_ids": category_ids,
+        }
+        payload = _drop_none(payload)
 
         resource = self._get_resource("/data/results/search_series", payload=payload)
         return self._get_chunks(resource.get("data", dict()).get("chunk_info"))
@@ -852,11 +1209,13 @@ class irDataClient:
             dict: a dict containing a list of sessions within the matching criteria.
 
         """
-        payload = {"season_id": season_id}
-        if event_type:
-            payload["event_type"] = event_type
-        if race_week_num is not None:
-            payload["race_week_num"] = race_week_num
+        payload = _drop_none(
+            {
+                "season_id": season_id,
+                "event_type": event_type,
+                "race_week_num": race_week_num,
+            }
+        )
 
         return self._get_resource("/data/results/season_results", payload=payload)
 
@@ -877,6 +1236,24 @@ class irDataClient:
         payload = {"cust_ids": cust_id, "include_licenses": include_licenses}
         return self._get_resource("/data/member/get", payload=payload)
 
+    def members(self, cust_ids: list[int], include_licenses: bool = False) -> Dict:
+        """Get member profile basic information from several members in one request.
+
+        Args:
+            cust_ids (list[int]): the cust_ids of the members to retrieve.
+            include_licenses (bool): whether if you want to include the licenses.
+             Default ``False``.
+
+        Returns:
+            dict: a dict containing the information of the members in ``'members'`` section.
+
+        """
+        payload = {
+            "cust_ids": ",".join(map(str, cust_ids)),
+            "include_licenses": include_licenses,
+        }
+        return self._get_resource("/data/member/get", payload=payload)
+
     def member_awards(self, cust_id: Optional[int] = None) -> list[Dict]:
         """Fetches a dict containing information on the members awards.
         Args:
@@ -937,6 +1314,20 @@ class irDataClient:
             payload["cust_id"] = cust_id
         return self._get_resource("/data/member/profile", payload=payload)
 
+    def member_profiles(self, cust_ids: Iterable[int]) -> list[Dict]:
+        """Detailed profile info from several members, fetched concurrently.
+
+        Args:
+            cust_ids (Iterable[int]): The iRacing cust_ids of the members.
+
+        Returns:
+            list: a list of dicts containing the profile info, in the order of ``cust_ids``.
+
+        """
+        return self._get_resources_many(
+            [("/data/member/profile", {"cust_id": cust_id}) for cust_id in cust_ids]
+        )
+
     def stats_member_bests(
         self, cust_id: Optional[int] = None, car_id: Optional[int] = None
     ) -> Dict:
@@ -974,6 +1365,23 @@ class irDataClient:
             payload["cust_id"] = cust_id
         return self._get_resource("/data/stats/member_career", payload=payload)
 
+    def stats_member_careers(self, cust_ids: Iterable[int]) -> list[Dict]:
+        """Get the career stats of several members, fetched concurrently.
+
+        Args:
+            cust_ids (Iterable[int]): The iRacing cust_ids of the members.
+
+        Returns:
+            list: a list of dicts containing the career stats, in the order of ``cust_ids``.
+
+        """
+        return self._get_resources_many(
+            [
+                ("/data/stats/member_career", {"cust_id": cust_id})
+                for cust_id in cust_ids
+            ]
+        )
+
     def stats_member_recap(
         self, cust_id: int = None, year: int = None, quarter: int = None
     ) -> Dict:
@@ -1028,6 +1436,23 @@ class irDataClient:
 
         return self._get_resource("/data/stats/member_summary", payload=payload)
 
+    def stats_member_summaries(self, cust_ids: Iterable[int]) -> list[Dict]:
+        """Get the stats summaries of several members, fetched concurrently.
+
+        Args:
+            cust_ids (Iterable[int]): The iRacing cust_ids of the members.
+
+        Returns:
+            list: a list of dicts containing the stats summaries, in the order of ``cust_ids``.
+
+        """
+        return self._get_resources_many(
+            [
+                ("/data/stats/member_summary", {"cust_id": cust_id})
+                for cust_id in cust_ids
+            ]
+        )
+
     def stats_member_yearly(self, cust_id: Optional[int] = None) -> Dict:
         """Get the member stats yearly from a certain cust_id
 
@@ -1066,13 +1491,15 @@ class irDataClient:
             dict: a dict containing the season driver standings
 
         """
-        payload = {"season_id": season_id, "car_class_id": car_class_id}
-        if race_week_num is not None:
-            payload["race_week_num"] = race_week_num
-        if club_id:
-            payload["club_id"] = club_id
-        if division is not None:
-            payload["division"] = division
+        payload = _drop_none(
+            {
+                "season_id": season_id,
+                "car_class_id": car_class_id,
+                "race_week_num": race_week_num,
+                "club_id": club_id,
+                "division": division,
+            }
+        )
 
         resource = self._get_resource(
             "/data/stats/season_driver_standings", payload=payload
@@ -1101,13 +1528,15 @@ class irDataClient:
             dict: a dict containing the season supersession standings
 
         """
-        payload = {"season_id": season_id, "car_class_id": car_class_id}
-        if race_week_num is not None:
-            payload["race_week_num"] = race_week_num
-        if club_id:
-            payload["club_id"] = club_id
-        if division is not None:
-            payload["division"] = division
+        payload = _drop_none(
+            {
+                "season_id": season_id,
+                "car_class_id": car_class_id,
+                "race_week_num": race_week_num,
+                "club_id": club_id,
+                "division": division,
+            }
+        )
 
         resource = self._get_resource(
             "/data/stats/season_supersession_standings", payload=payload
@@ -1128,9 +1557,13 @@ class irDataClient:
             dict: a dict containing the season team standings
 
         """
-        payload = {"season_id": season_id, "car_class_id": car_class_id}
-        if race_week_num is not None:
-            payload["race_week_num"] = race_week_num
+        payload = _drop_none(
+            {
+                "season_id": season_id,
+                "car_class_id": car_class_id,
+                "race_week_num": race_week_num,
+            }
+        )
 
         resource = self._get_resource(
             "/data/stats/season_team_standings", payload=payload
@@ -1158,13 +1591,15 @@ class irDataClient:
             dict: a dict containing the Time Trial standings
 
         """
-        payload = {"season_id": season_id, "car_class_id": car_class_id}
-        if race_week_num is not None:
-            payload["race_week_num"] = race_week_num
-        if club_id:
-            payload["club_id"] = club_id
-        if division is not None:
-            payload["division"] = division
+        payload = _drop_none(
+            {
+                "season_id": season_id,
+                "car_class_id": car_class_id,
+                "race_week_num": race_week_num,
+                "club_id": club_id,
+                "division": division,
+            }
+        )
 
         resource = self._get_resource(
             "/data/stats/season_tt_standings", payload=payload
@@ -1192,15 +1627,15 @@ class irDataClient:
             dict: a dict containing the Time Trial results
 
         """
-        payload = {
-            "season_id": season_id,
-            "car_class_id": car_class_id,
-            "race_week_num": race_week_num,
-        }
-        if club_id:
-            payload["club_id"] = club_id
-        if division is not None:
-            payload["division"] = division
+        payload = _drop_none(
+            {
+                "season_id": season_id,
+                "car_class_id": car_class_id,
+                "race_week_num": race_week_num,
+                "club_id": club_id,
+                "division": division,
+            }
+        )
 
         resource = self._get_resource("/data/stats/season_tt_results", payload=payload)
         return self._get_chunks(resource.get("chunk_info"))
@@ -1226,15 +1661,15 @@ class irDataClient:
             dict: a dict containing the qualifying results
 
         """
-        payload = {
-            "season_id": season_id,
-            "car_class_id": car_class_id,
-            "race_week_num": race_week_num,
-        }
-        if club_id:
-            payload["club_id"] = club_id
-        if division is not None:
-            payload["division"] = division
+        payload = _drop_none(
+            {
+                "season_id": season_id,
+                "car_class_id": car_class_id,
+                "race_week_num": race_week_num,
+                "club_id": club_id,
+                "division": division,
+            }
+        )
 
         resource = self._get_resource(
             "/data/stats/season_qualify_results", payload=payload
@@ -1260,11 +1695,14 @@ class irDataClient:
             dict: a dict containing the world records
 
         """
-        payload = {"car_id": car_id, "track_id": track_id}
-        if season_year:
-            payload["season_year"] = season_year
-        if season_quarter:
-            payload["season_quarter"] = season_quarter
+        payload = _drop_none(
+            {
+                "car_id": car_id,
+                "track_id": track_id,
+                "season_year": season_year,
+                "season_quarter": season_quarter,
+            }
+        )
 
         resource = self._get_resource("/data/stats/world_records", payload=payload)
         return self._get_chunks(resource.get("data", dict()).get("chunk_info"))
@@ -1284,6 +1722,7 @@ class irDataClient:
         payload = {"team_id": team_id, "include_licenses": include_licenses}
         return self._get_resource("/data/team/get", payload=payload)
 
+    @ttl_cache()
     def season_list(self, season_year: int, season_quarter: int) -> Dict:
         """Get the list of iRacing Official seasons given a year and quarter.
 
@@ -1313,21 +1752,19 @@ class irDataClient:
             dict: a dict containing the season schedule race guide.
 
         """
-        payload = {}
-        if start_from:
-            payload["from"] = start_from
-        if include_end_after_from:
-            payload["include_end_after_from"] = include_end_after_from
+        payload = _drop_none(
+            {"from": start_from, "include_end_after_from": include_end_after_from}
+        )
 
         return self._get_resource("/data/season/race_guide", payload=payload)
 
     def season_spectator_subsessionids(
-        self, event_types: list[int] = [2, 3, 4, 5]
+        self, event_types: Sequence[int] = (2, 3, 4, 5)
     ) -> list[int]:
         """Get the current list of subsession IDs for a given event type
 
         Args:
-            event_types (list[int]): A list of integers that match with iRacing event types as follows:
+            event_types (Sequence[int]): A list of integers that match with iRacing event types as follows:
                 2: Practise
                 3: Qualify
                 4: Time Trial
@@ -1338,12 +1775,13 @@ class irDataClient:
         """
         payload = {}
         if event_types:
-            payload["event_types"] = ",".join([str(x) for x in event_types])
+            payload["event_types"] = ",".join(map(str, event_types))
 
         return self._get_resource(
             "/data/season/spectator_subsessionids", payload=payload
         )["subsession_ids"]
 
+    @ttl_cache()
     def get_series(self) -> list[Dict]:
         """Get all the current official iRacing series.
 
@@ -1353,6 +1791,7 @@ class irDataClient:
         """
         return self._get_resource("/data/series/get")
 
+    @ttl_cache()
     def get_series_assets(self) -> Dict:
         """Get all the current official iRacing series assets.
 
@@ -1365,6 +1804,7 @@ class irDataClient:
         """
         return self._get_resource("/data/series/assets")
 
+    @ttl_cache()
     def series_past_seasons(self, series_id: int) -> Dict:
         """Get all seasons for a series.
 
@@ -1381,6 +1821,7 @@ class irDataClient:
             "series"
         )
 
+    @ttl_cache()
     def series_seasons(self, include_series: bool = False) -> list[Dict]:
         """Get the all the seasons.
 
@@ -1396,6 +1837,7 @@ class irDataClient:
         payload = {"include_series": include_series}
         return self._get_resource("/data/series/seasons", payload=payload)
 
+    @ttl_cache()
     def series_stats(self) -> list[Dict]:
         """Get the all the series and seasons.
 
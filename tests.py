@@ -1,12 +1,18 @@
 import base64
 import hashlib
+import json
+import os
+import tempfile
+import time
 import unittest
+import weakref
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import requests
+from urllib3.util import make_headers
 
-from src.iracingdataapi.client import irDataClient
+from src.iracingdataapi.client import MAX_ETAG_BODY_SIZE, irDataClient
 
 
 class TestIrDataClient(unittest.TestCase):
@@ -22,6 +28,33 @@ class TestIrDataClient(unittest.TestCase):
         encoded_password = self.client._encode_password("test_user", "test_password")
         self.assertEqual(encoded_password, expected_password)
 
+    def test_session_adapter(self):
+        adapter = self.client.session.get_adapter(self.client.base_url)
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertNotIn(429, adapter.max_retries.status_forcelist)
+
+    def test_share_connection_pool(self):
+        client = irDataClient(
+            username="test_user", password="test_password", share_connection_pool=True
+        )
+        other_client = irDataClient(
+            username="other_user", password="other_password", share_connection_pool=True
+        )
+
+        adapter = client.session.get_adapter(client.base_url)
+        self.assertIs(adapter, other_client.session.get_adapter(client.base_url))
+        self.assertIsNot(adapter, self.client.session.get_adapter(client.base_url))
+        self.assertIsNot(client.session.cookies, other_client.session.cookies)
+
+    def test_session_accept_encoding(self):
+        accept_encoding = self.client.session.headers["Accept-Encoding"]
+        self.assertIn("gzip", accept_encoding)
+        self.assertEqual(
+            accept_encoding, make_headers(accept_encoding=True)["accept-encoding"]
+        )
+
     @patch("requests.Session.post")
     def test_login_successful(self, mock_post):
         mock_response = MagicMock()
@@ -32,6 +65,16 @@ class TestIrDataClient(unittest.TestCase):
         self.client._login()
         self.assertTrue(self.client.authenticated)
 
+    @patch("requests.Session.post")
+    def test_login_clears_cache(self, mock_post):
+        mock_post.return_value = MagicMock(
+            status_code=200, json=lambda: {"authcode": "mock_authcode"}
+        )
+        self.client._cache[("get_cars", (), frozenset())] = (float("inf"), [])
+
+        self.client._login()
+        self.assertEqual(self.client._cache, {})
+
     @patch("requests.Session.post")
     def test_login_rate_limited(self, mock_post):
         mock_response = MagicMock()
@@ -55,6 +98,48 @@ class TestIrDataClient(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.client._login()
 
+    @patch("requests.Session.post")
+    def test_login_persists_cookies(self, mock_post):
+        mock_post.return_value = MagicMock(
+            status_code=200, json=lambda: {"authcode": "mock_authcode"}
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cookie_file = os.path.join(tmp_dir, "cookies.txt")
+            client = irDataClient(
+                username="test_user", password="test_password", cookie_file=cookie_file
+            )
+            self.assertFalse(client.authenticated)
+            client._login()
+            self.assertTrue(os.path.exists(cookie_file))
+            if os.name == "posix":
+                self.assertEqual(os.stat(cookie_file).st_mode & 0o777, 0o600)
+
+            other_client = irDataClient(
+                username="test_user", password="test_password", cookie_file=cookie_file
+            )
+            self.assertTrue(other_client.authenticated)
+
+    @unittest.skipUnless(os.name == "posix", "file modes are POSIX specific")
+    @patch("requests.Session.post")
+    def test_login_restricts_existing_cookie_file(self, mock_post):
+        mock_post.return_value = MagicMock(
+            status_code=200, json=lambda: {"authcode": "mock_authcode"}
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cookie_file = os.path.join(tmp_dir, "cookies.txt")
+            with open(cookie_file, "w") as f:
+                f.write("#LWP-Cookies-2.0\n")
+            os.chmod(cookie_file, 0o644)
+
+            client = irDataClient(
+                username="test_user", password="test_password", cookie_file=cookie_file
+            )
+            client._login()
+
+            self.assertEqual(os.stat(cookie_file).st_mode & 0o777, 0o600)
+
     def test_build_url(self):
         endpoint = "/test/endpoint"
         expected_url = self.client.base_url + endpoint
@@ -69,7 +154,7 @@ class TestIrDataClient(unittest.TestCase):
             status_code=200, json=lambda: {"authcode": "someauthcode"}
         )
         mock_get.return_value = MagicMock(
-            status_code=200, json=lambda: {"key": "value"}
+            status_code=200, json=lambda: {"key": "value"}, content=b'{"key": "value"}'
         )
 
         response = self.client._get_resource_or_link(self.client.base_url)
@@ -82,7 +167,7 @@ class TestIrDataClient(unittest.TestCase):
         self.client.authenticated = True
 
         mock_get.return_value = MagicMock(
-            status_code=200, json=lambda: {"key": "value"}
+            status_code=200, json=lambda: {"key": "value"}, content=b'{"key": "value"}'
         )
         response = self.client._get_resource_or_link(self.client.base_url)
         self.assertEqual(response, [{"key": "value"}, False])
@@ -92,7 +177,9 @@ class TestIrDataClient(unittest.TestCase):
     def test_get_resource_or_link_link(self, mock_login, mock_get):
         self.client.authenticated = True
         mock_get.return_value = MagicMock(
-            status_code=200, json=lambda: {"link": "some_link"}
+            status_code=200,
+            json=lambda: {"link": "some_link"},
+            content=b'{"link": "some_link"}',
         )
         response = self.client._get_resource_or_link(self.client.base_url)
         self.assertEqual(response, ["some_link", True])
@@ -107,6 +194,7 @@ class TestIrDataClient(unittest.TestCase):
             MagicMock(
                 status_code=200,
                 json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
                 headers={"Content-Type": "application/json"},
             ),
         ]
@@ -118,6 +206,19 @@ class TestIrDataClient(unittest.TestCase):
         response = self.client._get_resource_or_link(self.client.base_url)
         self.assertEqual(response, [{"key": "value"}, False])
 
+    @patch("requests.Session.get")
+    @patch.object(irDataClient, "_login", return_value=None)
+    def test_get_resource_or_link_repeated_401(self, mock_login, mock_get):
+        self.client.authenticated = True
+        mock_get.return_value = MagicMock(status_code=401)
+
+        with self.assertRaises(RuntimeError) as context:
+            self.client._get_resource_or_link(self.client.base_url)
+
+        self.assertIn("Unauthorised after logging in again", str(context.exception))
+        self.assertEqual(mock_get.call_count, 2)
+        mock_login.assert_called_once()
+
     @patch("requests.Session.get")
     def test_get_resource_or_link_handles_429(self, mock_get):
         self.client.authenticated = True
@@ -126,6 +227,7 @@ class TestIrDataClient(unittest.TestCase):
             MagicMock(
                 status_code=200,
                 json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
                 headers={"Content-Type": "application/json"},
             ),
         ]
@@ -133,6 +235,66 @@ class TestIrDataClient(unittest.TestCase):
         response = self.client._get_resource_or_link(self.client.base_url)
         self.assertEqual(response, [{"key": "value"}, False])
 
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    @patch("random.uniform", return_value=0)
+    def test_get_resource_or_link_429_without_reset_backs_off(
+        self, mock_uniform, mock_get, mock_sleep
+    ):
+        self.client.authenticated = True
+        mock_get.side_effect = [
+            MagicMock(status_code=429, headers={}),
+            MagicMock(status_code=429, headers={}),
+            MagicMock(
+                status_code=200,
+                json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
+                headers={},
+            ),
+        ]
+
+        response = self.client._get_resource_or_link(self.client.base_url)
+
+        self.assertEqual(response, [{"key": "value"}, False])
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.25, 0.5])
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_get_resource_or_link_gives_up_when_rate_limited(
+        self, mock_get, mock_sleep
+    ):
+        self.client.authenticated = True
+        mock_get.return_value = MagicMock(status_code=429, headers={})
+
+        with self.assertRaises(RuntimeError):
+            self.client._get_resource_or_link(self.client.base_url)
+
+        self.assertEqual(mock_get.call_count, 5)
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_get_resource_or_link_waits_for_rate_limit_reset(
+        self, mock_get, mock_sleep
+    ):
+        self.client.authenticated = True
+        reset = int(datetime.now().timestamp()) + 10
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            json=lambda: {"key": "value"},
+            content=b'{"key": "value"}',
+            headers={
+                "x-ratelimit-remaining": "0",
+                "x-ratelimit-reset": str(reset),
+            },
+        )
+
+        self.client._get_resource_or_link(self.client.base_url)
+        mock_sleep.assert_not_called()
+
+        self.client._get_resource_or_link(self.client.base_url)
+        mock_sleep.assert_called_once()
+        self.assertGreater(mock_sleep.call_args.args[0], 0)
+
     @patch("requests.Session.get")
     def test_get_resource_or_link_unhandled_error(self, mock_get):
         self.client.authenticated = True
@@ -141,6 +303,7 @@ class TestIrDataClient(unittest.TestCase):
             MagicMock(
                 status_code=200,
                 json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
                 headers={"Content-Type": "application/json"},
             ),
         ]
@@ -159,6 +322,7 @@ class TestIrDataClient(unittest.TestCase):
             MagicMock(
                 status_code=200,
                 json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
                 headers={"Content-Type": "application/json"},
             ),
         ]
@@ -166,6 +330,96 @@ class TestIrDataClient(unittest.TestCase):
         response = self.client._get_resource("/test/endpoint")
         self.assertEqual(response, {"key": "value"})
 
+    @patch("requests.Session.get")
+    @patch.object(irDataClient, "_get_resource_or_link")
+    def test_get_resource_reuses_unmodified_resource(
+        self, mock_resource_or_link, mock_get
+    ):
+        mock_resource_or_link.return_value = ["https://example.com/data", True]
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
+                headers={"Content-Type": "application/json", "ETag": '"abc"'},
+            ),
+            MagicMock(status_code=304, headers={}),
+        ]
+
+        first = self.client._get_resource("/data/some_endpoint", {"id": 1})
+        second = self.client._get_resource("/data/some_endpoint", {"id": 1})
+
+        self.assertEqual(first, {"key": "value"})
+        self.assertEqual(second, first)
+        self.assertIsNone(mock_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(
+            mock_get.call_args_list[1].kwargs["headers"], {"If-None-Match": '"abc"'}
+        )
+
+    @patch("requests.Session.get")
+    @patch.object(irDataClient, "_get_resource_or_link")
+    def test_get_resource_unmodified_resource_is_a_copy(
+        self, mock_resource_or_link, mock_get
+    ):
+        mock_resource_or_link.return_value = ["https://example.com/data", True]
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
+                headers={"Content-Type": "application/json", "ETag": '"abc"'},
+            ),
+            MagicMock(status_code=304, headers={}),
+        ]
+
+        first = self.client._get_resource("/data/some_endpoint")
+        first["key"] = "changed"
+        second = self.client._get_resource("/data/some_endpoint")
+
+        self.assertEqual(second, {"key": "value"})
+
+    @patch("requests.Session.get")
+    @patch.object(irDataClient, "_get_resource_or_link")
+    def test_get_resource_does_not_keep_large_bodies(
+        self, mock_resource_or_link, mock_get
+    ):
+        mock_resource_or_link.return_value = ["https://example.com/data", True]
+        body = b'["' + b"x" * MAX_ETAG_BODY_SIZE + b'"]'
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            content=body,
+            headers={"Content-Type": "application/json", "ETag": '"abc"'},
+        )
+
+        self.client._get_resource("/data/results/get", {"subsession_id": 1})
+        self.client._get_resource("/data/results/get", {"subsession_id": 1})
+
+        self.assertIsNone(mock_get.call_args_list[1].kwargs["headers"])
+
+    @patch("requests.Session.get")
+    def test_get_resource_with_list_payload(self, mock_get):
+        self.client.authenticated = True
+        mock_get.side_effect = [
+            MagicMock(
+                status_code=200,
+                json=lambda: {"link": "https://example.com/data"},
+                content=b'{"link": "https://example.com/data"}',
+                headers={},
+            ),
+            MagicMock(
+                status_code=200,
+                json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
+                headers={"Content-Type": "application/json", "ETag": '"abc"'},
+            ),
+        ]
+
+        response = self.client._get_resource(
+            "/data/results/search_series", {"event_types": [5], "season_year": 2024}
+        )
+
+        self.assertEqual(response, {"key": "value"})
+
     @patch("requests.Session.get")
     @patch.object(irDataClient, "_get_resource_or_link")
     def test_get_resource_handles_401(self, mock_resource_or_link, mock_get):
@@ -177,6 +431,7 @@ class TestIrDataClient(unittest.TestCase):
             MagicMock(
                 status_code=200,
                 json=lambda: {"key": "value"},
+                content=b'{"key": "value"}',
                 headers={"Content-Type": "application/json"},
             ),
         ]
@@ -198,6 +453,7 @@ class TestIrDataClient(unittest.TestCase):
             MagicMock(
                 status_code=200,
                 json=lambda: ["a link", True],
+                content=b'["a link", true]',
                 headers={"Content-Type": "application/json"},
             ),
         ]
@@ -213,14 +469,73 @@ class TestIrDataClient(unittest.TestCase):
             False,
         ]
         mock_get.return_value = MagicMock(
-            status_code=200, json=lambda: [{"chunked": "data"}]
+            status_code=200,
+            json=lambda: [{"chunked": "data"}],
+            content=b'[{"chunked": "data"}]',
+        )
+
+        chunks = self.client._get_chunks(
+            {"base_download_url": "http://example.com/", "chunk_file_names": ["chunk"]}
         )
 
+        self.assertEqual(chunks, [{"chunked": "data"}])
+
+    @patch("requests.Session.get")
+    def test_get_chunks_preserves_order(self, mock_get):
+        responses = {
+            "http://example.com/chunk_0": [{"row": 0}, {"row": 1}],
+            "http://example.com/chunk_1": [{"row": 2}],
+            "http://example.com/chunk_2": [{"row": 3}, {"row": 4}],
+        }
+        mock_get.side_effect = lambda url: MagicMock(
+            status_code=200,
+            json=lambda: responses[url],
+            content=json.dumps(responses[url]).encode(),
+        )
+
+        chunks = self.client._get_chunks(
+            {
+                "base_download_url": "http://example.com/",
+                "chunk_file_names": ["chunk_0", "chunk_1", "chunk_2"],
+            }
+        )
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(chunks, [{"row": i} for i in range(5)])
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_get_chunks_retries_rate_limited_chunk(self, mock_get, mock_sleep):
+        mock_get.side_effect = [
+            MagicMock(status_code=429, headers={}),
+            MagicMock(
+                status_code=200,
+                json=lambda: [{"chunked": "data"}],
+                content=b'[{"chunked": "data"}]',
+            ),
+        ]
+
         chunks = self.client._get_chunks(
             {"base_download_url": "http://example.com/", "chunk_file_names": ["chunk"]}
         )
 
         self.assertEqual(chunks, [{"chunked": "data"}])
+        mock_sleep.assert_called_once()
+
+    def test_get_chunks_no_chunk_files(self):
+        chunks = self.client._get_chunks(
+            {"base_download_url": "http://example.com/", "chunk_file_names": []}
+        )
+        self.assertEqual(chunks, [])
+
+    def test_parse_json(self):
+        response = MagicMock(content=b'{"key": "value"}', json=lambda: {"key": "value"})
+        self.assertEqual(self.client._parse_json(response), {"key": "value"})
+
+    @patch("src.iracingdataapi.client.orjson", None)
+    def test_parse_json_without_orjson(self):
+        response = MagicMock(json=lambda: {"key": "value"})
+        self.assertEqual(self.client._parse_json(response), {"key": "value"})
 
     def test_add_assets(self):
         objects = [{"id": 1}, {"id": 2}]
@@ -230,6 +545,84 @@ class TestIrDataClient(unittest.TestCase):
 
         result = self.client._add_assets(objects, assets, id_key)
         self.assertEqual(result, expected_result)
+        self.assertEqual(objects, [{"id": 1}, {"id": 2}])
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_static_endpoint_is_cached(self, mock_get_resource):
+        mock_get_resource.return_value = [{"car_id": 1}]
+
+        first = self.client.get_cars()
+        second = self.client.get_cars()
+
+        mock_get_resource.assert_called_once_with("/data/car/get")
+        self.assertEqual(first, second)
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_static_endpoint_cache_returns_copies(self, mock_get_resource):
+        mock_get_resource.return_value = [{"car_id": 1, "name": "Car One"}]
+
+        self.client.get_cars()[0]["name"] = "mutated"
+        self.client.get_cars().clear()
+
+        self.assertEqual(self.client.get_cars(), [{"car_id": 1, "name": "Car One"}])
+
+    @patch("time.monotonic")
+    @patch.object(irDataClient, "_get_resource")
+    def test_static_endpoint_cache_expires(self, mock_get_resource, mock_monotonic):
+        mock_get_resource.side_effect = [[{"car_id": 1}], [{"car_id": 2}]]
+        mock_monotonic.return_value = 1000.0
+        self.client.get_cars()
+
+        mock_monotonic.return_value = 1000.0 + 3601
+        cars = self.client.get_cars()
+
+        self.assertEqual(mock_get_resource.call_count, 2)
+        self.assertEqual(cars, [{"car_id": 2}])
+
+    @patch.object(irDataClient, "_get_resources_many")
+    def test_stats_member_careers(self, mock_get_resources_many):
+        mock_get_resources_many.return_value = [{"cust_id": 1}, {"cust_id": 2}]
+
+        response = self.client.stats_member_careers([1, 2])
+
+        mock_get_resources_many.assert_called_once_with(
+            [
+                ("/data/stats/member_career", {"cust_id": 1}),
+                ("/data/stats/member_career", {"cust_id": 2}),
+            ]
+        )
+        self.assertEqual(response, [{"cust_id": 1}, {"cust_id": 2}])
+
+    @patch.object(irDataClient, "_get_resources_many")
+    def test_stats_member_summaries(self, mock_get_resources_many):
+        mock_get_resources_many.return_value = [{"cust_id": 1}]
+
+        response = self.client.stats_member_summaries([1])
+
+        mock_get_resources_many.assert_called_once_with(
+            [("/data/stats/member_summary", {"cust_id": 1})]
+        )
+        self.assertEqual(response, [{"cust_id": 1}])
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_member_profiles(self, mock_get_resource):
+        mock_get_resource.side_effect = lambda endpoint, payload: payload
+
+        response = self.client.member_profiles([1, 2])
+
+        self.assertEqual(response, [{"cust_id": 1}, {"cust_id": 2}])
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_season_list_is_cached_per_season(self, mock_get_resource):
+        mock_get_resource.side_effect = lambda endpoint, payload: dict(payload)
+
+        first = self.client.season_list(2022, 1)
+        self.client.season_list(2022, 1)
+        other = self.client.season_list(2022, 2)
+
+        self.assertEqual(mock_get_resource.call_count, 2)
+        self.assertEqual(first["season_quarter"], 1)
+        self.assertEqual(other["season_quarter"], 2)
 
     @patch.object(irDataClient, "_get_resource")
     def test_result_with_parameters(self, mock_get_resource):
@@ -265,6 +658,86 @@ class TestIrDataClient(unittest.TestCase):
         )
         self.assertEqual(response, {"result": "some data"})
 
+    @patch.object(irDataClient, "_get_resource")
+    def test_result_is_cached_on_disk(self, mock_get_resource):
+        mock_get_resource.return_value = {"subsession_id": 12345}
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = irDataClient(
+                username="test_user", password="test_password", cache_dir=cache_dir
+            )
+            first = client.result(subsession_id=12345)
+
+            other_client = irDataClient(
+                username="test_user", password="test_password", cache_dir=cache_dir
+            )
+            second = other_client.result(subsession_id=12345)
+
+        mock_get_resource.assert_called_once()
+        self.assertEqual(first, {"subsession_id": 12345})
+        self.assertEqual(second, first)
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_result_none_is_not_cached_on_disk(self, mock_get_resource):
+        mock_get_resource.side_effect = [None, {"subsession_id": 12345}]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = irDataClient(cache_dir=cache_dir)
+            self.assertIsNone(client.result(subsession_id=12345))
+            self.assertEqual(os.listdir(cache_dir), [])
+            second = client.result(subsession_id=12345)
+
+        self.assertEqual(mock_get_resource.call_count, 2)
+        self.assertEqual(second, {"subsession_id": 12345})
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_truncated_disk_cache_is_fetched_again(self, mock_get_resource):
+        mock_get_resource.return_value = {"subsession_id": 12345}
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = irDataClient(cache_dir=cache_dir)
+            client.result(subsession_id=12345)
+            (path,) = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"subsession_')
+
+            result = client.result(subsession_id=12345)
+            with open(path, "r", encoding="utf-8") as f:
+                rewritten = json.load(f)
+
+        self.assertEqual(mock_get_resource.call_count, 2)
+        self.assertEqual(result, {"subsession_id": 12345})
+        self.assertEqual(rewritten, result)
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_failed_disk_cache_write_leaves_no_temp_file(self, mock_get_resource):
+        mock_get_resource.return_value = {"not_json": object()}
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = irDataClient(cache_dir=cache_dir)
+            with self.assertRaises(TypeError):
+                client.result(subsession_id=12345)
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_constants_disk_cache_expires(self, mock_get_resource):
+        mock_get_resource.return_value = [{"label": "Oval", "value": 1}]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = irDataClient(
+                username="test_user", password="test_password", cache_dir=cache_dir
+            )
+            client.constants_categories()
+            irDataClient(cache_dir=cache_dir).constants_categories()
+            mock_get_resource.assert_called_once()
+
+            (path,) = [os.path.join(cache_dir, f) for f in os.listdir(cache_dir)]
+            stale = os.path.getmtime(path) - 86401
+            os.utime(path, (stale, stale))
+            irDataClient(cache_dir=cache_dir).constants_categories()
+
+        self.assertEqual(mock_get_resource.call_count, 2)
+
     def test_result_missing_subsession_id(self):
         client = irDataClient(username="test_user", password="test_password")
 
@@ -472,6 +945,28 @@ class TestIrDataClient(unittest.TestCase):
         mock_get_chunks.assert_called_once_with("chunk_data")
         self.assertEqual(response, ["result1", "result2"])
 
+    @patch.object(irDataClient, "_get_chunks")
+    @patch.object(irDataClient, "_get_resource")
+    def test_result_search_series_keeps_falsy_parameters(
+        self, mock_get_resource, mock_get_chunks
+    ):
+        mock_get_resource.return_value = {"data": {"chunk_info": "chunk_data"}}
+        mock_get_chunks.return_value = []
+
+        self.client.result_search_series(
+            season_year=2021, season_quarter=2, race_week_num=0, official_only=False
+        )
+
+        mock_get_resource.assert_called_once_with(
+            "/data/results/search_series",
+            payload={
+                "season_year": 2021,
+                "season_quarter": 2,
+                "race_week_num": 0,
+                "official_only": False,
+            },
+        )
+
     @patch.object(irDataClient, "_get_chunks")
     @patch.object(irDataClient, "_get_resource")
     def test_result_search_series_raises_without_required_parameters(
@@ -535,6 +1030,22 @@ class TestIrDataClient(unittest.TestCase):
         )
         self.assertEqual(response, {"members": [{"cust_id": cust_ids}]})
 
+    @patch.object(irDataClient, "_get_resource")
+    def test_members(self, mock_get_resource):
+        mock_get_resource.return_value = {
+            "members": [{"cust_id": 12345}, {"cust_id": 67890}]
+        }
+
+        response = self.client.members(cust_ids=[12345, 67890])
+
+        mock_get_resource.assert_called_once_with(
+            "/data/member/get",
+            payload={"cust_ids": "12345,67890", "include_licenses": False},
+        )
+        self.assertEqual(
+            response, {"members": [{"cust_id": 12345}, {"cust_id": 67890}]}
+        )
+
     def test_member_missing_cust_id(self):
         client = irDataClient(username="test_user", password="test_password")
 
@@ -570,18 +1081,15 @@ class TestIrDataClient(unittest.TestCase):
         result = self.client._parse_csv_response(csv_text)
         self.assertEqual(result, expected_output)
 
-    @patch("builtins.print")
-    def test_parse_csv_response_mismatch(self, mock_print):
+    def test_parse_csv_response_mismatch(self):
         # Test with row length mismatch
         csv_text = "Name,Age,Location\nAlice,30,NY\nBob,25"
         expected_output = [{"name": "Alice", "age": "30", "location": "NY"}]
 
-        result = self.client._parse_csv_response(csv_text)
+        with self.assertLogs("src.iracingdataapi.client", level="WARNING") as logs:
+            result = self.client._parse_csv_response(csv_text)
         self.assertEqual(result, expected_output)
-        self.assertTrue(mock_print.called)
-        self.assertTrue(
-            mock_print.called_with("Warning: Row length does not match headers length")
-        )
+        self.assertIn("Row length does not match headers length", logs.output[0])
 
     @patch.object(irDataClient, "get_cars")
     @patch.object(irDataClient, "get_cars_assets")
@@ -731,6 +1239,121 @@ class TestIrDataClient(unittest.TestCase):
 
         self.assertEqual(series_with_assets, expected_series_with_assets)
 
+    @patch.object(irDataClient, "get_tracks")
+    @patch.object(irDataClient, "get_tracks_assets")
+    def test_tracks_property_is_cached(self, mock_get_tracks_assets, mock_get_tracks):
+        mock_get_tracks.return_value = [{"track_id": 1, "name": "Track One"}]
+        mock_get_tracks_assets.return_value = {"1": {"image": "image1_url"}}
+
+        first = self.client.tracks
+        second = self.client.tracks
+
+        mock_get_tracks.assert_called_once()
+        mock_get_tracks_assets.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first, [{"track_id": 1, "name": "Track One", "image": "image1_url"}]
+        )
+
+    @patch("requests.Session.get")
+    def test_tracks_property_logs_in_once(self, mock_get):
+        def login(client):
+            time.sleep(0.05)
+            client.authenticated = True
+
+        def get(url, params=None):
+            if url.endswith("/data/track/get"):
+                return MagicMock(
+                    status_code=200,
+                    json=lambda: [{"track_id": 1}],
+                    content=b'[{"track_id": 1}]',
+                    headers={},
+                )
+            return MagicMock(
+                status_code=200,
+                json=lambda: {"1": {"logo": "logo_url"}},
+                content=b'{"1": {"logo": "logo_url"}}',
+                headers={},
+            )
+
+        mock_get.side_effect = get
+
+        with patch.object(
+            irDataClient, "_login", autospec=True, side_effect=login
+        ) as mock_login:
+            tracks = self.client.tracks
+
+        mock_login.assert_called_once()
+        self.assertEqual(tracks, [{"track_id": 1, "logo": "logo_url"}])
+
+    def test_run_concurrently(self):
+        results = self.client._run_concurrently(lambda: "first", lambda: "second")
+        self.assertEqual(results, ["first", "second"])
+
+    @patch.object(irDataClient, "_get_resource")
+    def test_get_resources_many(self, mock_get_resource):
+        mock_get_resource.side_effect = lambda endpoint, payload: (
+            endpoint,
+            payload["cust_id"],
+        )
+        results = self.client._get_resources_many(
+            [("/data/a", {"cust_id": 1}), ("/data/b", {"cust_id": 2})]
+        )
+        self.assertEqual(results, [("/data/a", 1), ("/data/b", 2)])
+
+    def test_get_resources_many_empty(self):
+        self.assertEqual(self.client._get_resources_many([]), [])
+
+    def test_client_supports_weak_references(self):
+        ref = weakref.ref(self.client)
+        self.assertIs(ref(), self.client)
+
+    def test_init_without_credentials(self):
+        client = irDataClient()
+        self.assertIsNone(client.encoded_password)
+
+    @patch("requests.Session.post")
+    def test_login_without_credentials(self, mock_post):
+        for client in (irDataClient(), irDataClient(username="test_user")):
+            with self.assertRaisesRegex(RuntimeError, "username and password"):
+                client._login()
+        mock_post.assert_not_called()
+
+    @patch("requests.Session.post")
+    def test_login_encodes_password_once(self, mock_post):
+        mock_post.return_value = MagicMock(
+            status_code=200, json=lambda: {"authcode": "abc"}
+        )
+        with patch.object(
+            self.client, "_encode_password", wraps=self.client._encode_password
+        ) as mock_encode:
+            self.client._login()
+            self.client._login()
+
+        mock_encode.assert_called_once_with("test_user", "test_password")
+        self.assertEqual(
+            mock_post.call_args.kwargs["json"]["password"],
+            self.client.encoded_password,
+        )
+
+    @patch("requests.Session.post")
+    def test_login_forgets_plaintext_password(self, mock_post):
+        mock_post.return_value = MagicMock(
+            status_code=200, json=lambda: {"authcode": "abc"}
+        )
+        self.client._login()
+
+        self.assertIsNone(self.client._password)
+        self.assertIsNotNone(self.client.encoded_password)
+
+    def test_init_does_not_make_requests(self):
+        with patch("requests.Session.get") as mock_get, patch(
+            "requests.Session.post"
+        ) as mock_post:
+            irDataClient(username="test_user", password="test_password")
+            mock_get.assert_not_called()
+            mock_post.assert_not_called()
+
     @patch.object(irDataClient, "_get_resource")
     def test_driver_list(self, mock_get_resource):
         # Setup mock return values for different categories
@@ -841,8 +1464,6 @@ class TestIrDataClient(unittest.TestCase):
             "minimum_roster_count": 0,
             "maximum_roster_count": 999,
             "lowerbound": 1,
-            "upperbound": None,
-            "sort": None,
             "order": "asc",
         }
 
@@ -1566,6 +2187,16 @@ class TestIrDataClient(unittest.TestCase):
         )
         self.assertEqual(result, mock_get_resource.return_value)
 
+    @patch.object(irDataClient, "_get_resource")
+    def test_season_race_guide_keeps_false(self, mock_get_resource):
+        mock_get_resource.return_value = [{"race_guide": "race_guide"}]
+
+        self.client.season_race_guide(include_end_after_from=False)
+
+        mock_get_resource.assert_called_once_with(
+            "/data/season/race_guide", payload={"include_end_after_from": False}
+        )
+
     @patch.object(irDataClient, "_get_resource")
     def test_series_past_seasons(self, mock_get_resource):
         series_id = 123